@@ -3,16 +3,11 @@
 """Sphinx configuration file for Calculator Example documentation.
 
 This file configures Sphinx to generate documentation for the calculator project.
-It sets up autodoc, type hints, and theme settings.
+It sets up AutoAPI, type hints, and theme settings.
 """
 
-import os
-import sys
 from datetime import datetime
 
-# Add project to path for autodoc
-sys.path.insert(0, os.path.abspath('../../src'))
-
 # Project information
 project = 'Calculator Example'
 copyright = f'{datetime.now().year}, Marco Lanconelli'
@@ -22,11 +17,10 @@ version = '0.1.0'
 
 # General configuration
 extensions = [
-    'sphinx.ext.autodoc',
+    'autoapi.extension',
     'sphinx.ext.napoleon',
     'sphinx.ext.viewcode',
     'sphinx.ext.intersphinx',
-    'sphinx_autodoc_typehints',
     'myst_parser',
 ]
 
@@ -49,19 +43,27 @@ exclude_patterns = []
 html_theme = 'sphinx_rtd_theme'
 html_static_path = ['_static']
 
-# Autodoc configuration
-autodoc_default_options = {
-    'members': True,
-    'member-order': 'bysource',
-    'special-members': '__init__',
-    'undoc-members': True,
-    'exclude-members': '__weakref__'
-}
+# AutoAPI configuration: sources are parsed statically, the package is never imported.
+# API pages are not generated; the autoapi* directives in the .rst files pick members.
+autoapi_type = 'python'
+autoapi_dirs = ['../../src/calculator']
+autoapi_generate_api_docs = False
+autoapi_add_toctree_entry = False
+autoapi_member_order = 'bysource'
+autoapi_options = [
+    'members',
+    'undoc-members',
+    'show-inheritance',
+    'special-members',
+]
+autoapi_python_class_content = 'both'
 
 # Napoleon settings (for Google/NumPy style docstrings)
 napoleon_google_docstring = True
 napoleon_numpy_docstring = True
 napoleon_include_init_with_doc = True
+# Render "Attributes:" sections as fields; AutoAPI already documents the attributes
+napoleon_use_ivar = True
 
 # Intersphinx mapping
 intersphinx_mapping = {
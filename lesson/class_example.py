@@ -1,13 +1,19 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from itertools import count
+from math import hypot
 
 # 1. Class vs Static vs Instance Methods
 class MyClass:
+    __slots__ = ("value", "_id")
     counter = 0
-    
+    _ids = count(1)
+
     def __init__(self, value):
         self.value = value
-        MyClass.counter += 1
+        # next() non perde mai un incremento: ogni istanza ha un _id univoco
+        self._id = next(MyClass._ids)
+        MyClass.counter = self._id
     
     def instance_method(self):
         return f"Valore: {self.value}"
@@ -23,6 +29,8 @@ class MyClass:
 
 # 2. Proprietà con @property
 class Persona:
+    __slots__ = ("nome", "_eta")
+
     def __init__(self, nome, eta):
         self.nome = nome
         self._eta = eta
@@ -40,6 +48,8 @@ class Persona:
 
 # 3. Metodi speciali
 class Vettore:
+    __slots__ = ("x", "y")
+
     def __init__(self, x, y):
         self.x, self.y = x, y
     
@@ -49,8 +59,9 @@ class Vettore:
     def __add__(self, other):
         return Vettore(self.x + other.x, self.y + other.y)
     
-    def __len__(self):
-        return abs(self.x) + abs(self.y)
+    @property
+    def magnitude(self):
+        return hypot(self.x, self.y)
     
     def __eq__(self, other):
         return self.x == other.x and self.y == other.y
@@ -58,6 +69,8 @@ class Vettore:
 
 # 4. Ereditarietà e super()
 class Animale:
+    __slots__ = ("nome",)
+
     def __init__(self, nome):
         self.nome = nome
     
@@ -66,6 +79,8 @@ class Animale:
 
 
 class Cane(Animale):
+    __slots__ = ("razza",)
+
     def __init__(self, nome, razza):
         super().__init__(nome)
         self.razza = razza
@@ -76,12 +91,16 @@ class Cane(Animale):
 
 # 5. Classi astratte
 class Forma(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def area(self):
         pass
 
 
 class Cerchio(Forma):
+    __slots__ = ("r",)
+
     def __init__(self, raggio):
         self.r = raggio
     
@@ -111,8 +130,10 @@ class MiaClasse(metaclass=Meta):
 
 
 # 8. Dataclass
+# slots=True richiede Python 3.10; senza valori di default basta __slots__
 @dataclass
 class Punto:
+    __slots__ = ("x", "y")
     x: int
     y: int
 
@@ -136,7 +157,7 @@ if __name__ == "__main__":
     v1 = Vettore(1, 2)
     v2 = Vettore(3, 4)
     print(v1 + v2)
-    print(len(v1))
+    print(Vettore(3, 4).magnitude)
     print(v1 == Vettore(1, 2))
     
     # 4
@@ -2,25 +2,30 @@
 
 import logging
 import calculator
+from src.calculator.calculator import add, divide, multiply
 from src.calculator.calculator_class import Calculator
 
 logging.basicConfig(
     level=logging.DEBUG, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
+_FUNC_OPS = {
+    "add": add,
+    "mul": multiply,
+    "div": divide,
+}
 
-def main_functional(op: str, a: float, b: float) -> None:
-    """Old main"""
-    from src.calculator.calculator import add, divide, multiply
+_OOP_OPS = {
+    "add": "add",
+    "mul": "multiply",
+    "div": "divide",
+}
 
-    operations = {
-        "add": add,
-        "mul": multiply,
-        "div": divide,
-    }
 
+def main_functional(op: str, a: float, b: float) -> None:
+    """Old main"""
     try:
-        result = operations[op](a, b)
+        result = _FUNC_OPS[op](a, b)
         logging.info(f"Functional Result: {result}")
     except ValueError as e:
         logging.error(f"Functional Error: {e}")
@@ -30,14 +35,8 @@ def main_oop(op: str, a: float, b: float) -> None:
     """New main oop"""
     calc = Calculator(precision=2)
 
-    operations = {
-        "add": calc.add,
-        "mul": calc.multiply,
-        "div": calc.divide,
-    }
-
     try:
-        result = operations[op](a, b)
+        result = getattr(calc, _OOP_OPS[op])(a, b)
         logging.info(f"OOP Result: {result}")
         logging.info(f"History: {calc.get_history()}")
     except ValueError as e:
@@ -0,0 +1,31 @@
+"""Optional compiled build for the calculator package.
+
+Project metadata lives in pyproject.toml. This file only adds C extensions
+when ``CALCULATOR_USE_MYPYC=1`` is set, compiling the functional module with
+mypyc. Without the flag the package installs as pure Python.
+"""
+
+import os
+import sys
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("CALCULATOR_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    # The [tool.mypy] settings are for type checking, not compilation; skip them
+    # and target the running interpreter, the only one that can load the result.
+    python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    ext_modules = mypycify(
+        [
+            "--config-file",
+            os.devnull,
+            "--python-version",
+            python_version,
+            "--ignore-missing-imports",  # numpy is an optional extra
+            "src/calculator/calculator.py",
+        ]
+    )
+
+setup(ext_modules=ext_modules)
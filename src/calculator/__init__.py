@@ -15,8 +15,17 @@ __project__ = "Calculator"
 __author__ = "Marco Lanconelli"
 __email__ = "m.lanconelli@example.com"
 
-from calculator.calculator import add, calculate_average, divide, multiply
-from calculator.calculator_class import Calculator
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from calculator.calculator import (
+        add,
+        calculate_average,
+        calculate_average_np,
+        divide,
+        multiply,
+    )
+    from calculator.calculator_class import Calculator
 
 # import logging
 # logging.basicConfig(
@@ -29,5 +38,46 @@ __all__ = [
     "divide",
     "multiply",
     "calculate_average",
+    "calculate_average_np",
     "Calculator",
 ]
+
+# Public name -> submodule that defines it. Submodules are imported on first
+# attribute access so that ``import calculator`` stays cheap.
+_LAZY_EXPORTS = {
+    "add": "calculator.calculator",
+    "divide": "calculator.calculator",
+    "multiply": "calculator.calculator",
+    "calculate_average": "calculator.calculator",
+    "calculate_average_np": "calculator.calculator",
+    "Calculator": "calculator.calculator_class",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names lazily and cache them in the module globals.
+
+    Args:
+        name: Attribute requested on the package
+
+    Returns:
+        The object exported under ``name``
+
+    Raises:
+        AttributeError: If ``name`` is not a public export
+    """
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes, including not-yet-imported lazy exports."""
+    return sorted(set(globals()) | set(__all__))
@@ -9,13 +9,17 @@ Functions:
     divide: Divide two numbers with zero-check
     multiply: Multiply two numbers
     calculate_average: Calculate average of a list of numbers
+    calculate_average_np: Calculate average of an array using NumPy
 
 Author: Marco Lanconelli
 Email: m.lanconelli@example.com
 License: MIT
 """
 
-from typing import List
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
 
 
 def add(a: float, b: float) -> float:
@@ -101,3 +105,30 @@ def calculate_average(numbers: List[float]) -> float:
     if not numbers:
         raise ValueError("Cannot calculate average of empty list")
     return sum(numbers) / len(numbers)
+
+
+def calculate_average_np(arr: "ArrayLike") -> float:
+    """Calculate average of an array of numbers using NumPy.
+
+    Vectorized alternative to calculate_average for large inputs. NumPy is
+    imported on first call, so it is only required by callers of this function.
+
+    Args:
+        arr: Array or sequence of numbers to average
+
+    Returns:
+        Average value of the numbers
+
+    Raises:
+        ValueError: If the array is empty
+
+    Examples:
+        >>> calculate_average_np([1, 2, 3])
+        2.0
+    """
+    import numpy as np
+
+    values = np.asarray(arr, dtype=np.float64)
+    if values.size == 0:
+        raise ValueError("Cannot calculate average of empty list")
+    return float(values.mean())
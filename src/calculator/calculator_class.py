@@ -12,24 +12,30 @@ Email: m.lanconelli@example.com
 License: MIT
 """
 
-import logging
-from typing import List, Optional
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Deque, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import logging
+
+# History template recorded for a failed division
+_DIVZERO_FMT = "{} / {} = ERROR"
 
 
 class Calculator:
     """Calculator class with history tracking and operation chaining.
 
     This class provides basic arithmetic operations with additional features:
-    - Operation history tracking
+    - Operation history tracking, bounded to the most recent entries
     - Configurable precision for results
     - Operation chaining using the last result
     - Logging support
 
     Attributes:
         precision: Number of decimal places for rounding
-        history: List of operation strings
+        history: Bounded deque of (format, args) pairs, rendered by get_history()
         last_result: The result of the last operation
-        logger: Logger instance for debugging
+        logger: Logger instance for debugging, created on first use
 
     Examples:
         >>> calc = Calculator(precision=2)
@@ -39,16 +45,21 @@ class Calculator:
         60.0
     """
 
-    def __init__(self, precision: int = 2) -> None:
+    # Chainable operation name -> method name
+    _OPS = {"add": "add", "mul": "multiply", "div": "divide"}
+
+    def __init__(self, precision: int = 2, history_limit: Optional[int] = 1024) -> None:
         """Initialize calculator with optional precision.
 
         Args:
             precision: Number of decimal places for rounding (default: 2)
+            history_limit: Maximum number of operations kept in history; older
+                entries are discarded first. None keeps everything (default: 1024)
         """
         self.precision = precision
-        self.history: List[str] = []
+        self.history: Deque[Tuple[str, Tuple[object, ...]]] = deque(maxlen=history_limit)
         self.last_result: Optional[float] = None
-        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger: Optional[logging.Logger] = None
 
     def add(self, a: float, b: float) -> float:
         """Add two numbers.
@@ -61,7 +72,7 @@ class Calculator:
             Sum of a and b, rounded to specified precision
         """
         result = round(a + b, self.precision)
-        self._log_operation(f"{a} + {b} = {result}")
+        self._log_operation(result, "{} + {} = {}", a, b, result)
         return result
 
     def divide(self, a: float, b: float) -> float:
@@ -77,11 +88,11 @@ class Calculator:
         Raises:
             ValueError: If b is zero
         """
-        if b == 0:
-            self._log_operation(f"{a} / {b} = ERROR", error=True)
+        if not b:
+            self._log_operation(None, _DIVZERO_FMT, a, b, error=True)
             raise ValueError("Cannot divide by zero")
         result = round(a / b, self.precision)
-        self._log_operation(f"{a} / {b} = {result}")
+        self._log_operation(result, "{} / {} = {}", a, b, result)
         return result
 
     def multiply(self, a: float, b: float) -> float:
@@ -95,7 +106,7 @@ class Calculator:
             Product of a and b, rounded to specified precision
         """
         result = round(a * b, self.precision)
-        self._log_operation(f"{a} * {b} = {result}")
+        self._log_operation(result, "{} * {} = {}", a, b, result)
         return result
 
     def calculate_average(self, numbers: List[float]) -> float:
@@ -113,36 +124,68 @@ class Calculator:
         if not numbers:
             raise ValueError("Cannot calculate average of empty list")
         result = round(sum(numbers) / len(numbers), self.precision)
-        self._log_operation(f"avg({numbers}) = {result}")
+        self._log_operation(result, "avg({}) = {}", list(numbers), result)
         return result
 
-    def _log_operation(self, operation: str, error: bool = False) -> None:
+    def _log_operation(
+        self, result: Optional[float], fmt: str, *args: object, error: bool = False
+    ) -> None:
         """Log operation to history.
 
         Private method to track operations in history and update last_result.
+        The operation string is only rendered when it is actually read.
 
         Args:
-            operation: String representation of the operation
+            result: Numeric result of the operation, None on error
+            fmt: ``str.format`` template describing the operation
+            *args: Values substituted into ``fmt``
             error: Whether this operation resulted in an error
         """
-        self.history.append(operation)
-        if not error:
-            self.last_result = float(operation.split("=")[-1].strip())
-        self.logger.debug(f"Operation: {operation}")
+        self.history.append((fmt, args))
+        if not error and result is not None:
+            self.last_result = float(result)
+        logger = self._get_logger()
+        if logger.isEnabledFor(self._debug_level):
+            logger.debug("Operation: %s", fmt.format(*args))
+
+    def _get_logger(self) -> "logging.Logger":
+        """Get the instance logger, creating it on first use.
+
+        Returns:
+            Logger named after the calculator class
+        """
+        if self.logger is None:
+            # Deferred so that importing this module does not pull in logging
+            import logging
 
-    def get_history(self) -> List[str]:
+            self.logger = logging.getLogger(type(self).__name__)
+            # Cached so _log_operation can check the level without importing logging
+            self._debug_level = logging.DEBUG
+        return self.logger
+
+    def get_history(self) -> Tuple[str, ...]:
         """Get calculation history.
 
         Returns:
-            List of all operations performed
+            Immutable snapshot of all operations performed
         """
-        return self.history
+        return tuple(fmt.format(*args) for fmt, args in self.history)
+
+    def iter_history(self) -> Iterator[str]:
+        """Iterate over calculation history without building a snapshot.
+
+        The history must not be modified while iterating.
+
+        Returns:
+            Iterator over the operations performed, oldest first
+        """
+        return (fmt.format(*args) for fmt, args in self.history)
 
     def clear_history(self) -> None:
         """Clear calculation history and reset last result."""
-        self.history = []
+        self.history.clear()
         self.last_result = None
-        self.logger.info("History cleared")
+        self._get_logger().info("History cleared")
 
     def chain_operation(self, op: str, value: float) -> float:
         """Chain operation using last result.
@@ -169,13 +212,10 @@ class Calculator:
         if self.last_result is None:
             raise ValueError("No previous result to chain")
 
-        operations = {
-            "add": lambda x, y: self.add(x, y),
-            "mul": lambda x, y: self.multiply(x, y),
-            "div": lambda x, y: self.divide(x, y),
-        }
-
-        if op not in operations:
-            raise ValueError(f"Unknown operation: {op}")
+        try:
+            method_name = self._OPS[op]
+        except KeyError:
+            raise ValueError(f"Unknown operation: {op}") from None
 
-        return operations[op](self.last_result, value)
+        method: Callable[[float, float], float] = getattr(self, method_name)
+        return method(self.last_result, value)
@@ -2,7 +2,13 @@
 
 import pytest
 
-from calculator.calculator import add, calculate_average, divide, multiply
+from calculator.calculator import (
+    add,
+    calculate_average,
+    calculate_average_np,
+    divide,
+    multiply,
+)
 
 
 class TestCalculator:
@@ -50,6 +56,40 @@ class TestCalculator:
             calculate_average([])
 
 
+class TestCalculateAverageNp:
+    """Test NumPy average."""
+
+    @pytest.fixture(autouse=True)
+    def _require_numpy(self):
+        pytest.importorskip("numpy")
+
+    @pytest.mark.parametrize(
+        "numbers,expected",
+        [
+            ([1, 2, 3], 2.0),
+            ([10, 20, 30], 20.0),
+            ([5], 5.0),
+            ([-1, 0, 1], 0.0),
+        ],
+    )
+    def test_calculate_average_np(self, numbers, expected):
+        """Test NumPy average matches the pure-Python version."""
+        result = calculate_average_np(numbers)
+        assert result == expected
+        assert type(result) is float
+
+    def test_calculate_average_np_array(self):
+        """Test NumPy average accepts ndarray input."""
+        import numpy as np
+
+        assert calculate_average_np(np.arange(1, 101)) == 50.5
+
+    def test_calculate_average_np_empty(self):
+        """Test average of empty array raises error."""
+        with pytest.raises(ValueError, match="empty list"):
+            calculate_average_np([])
+
+
 class TestCalculatorIntegration:
     """Integration tests."""
 
@@ -13,19 +13,28 @@ class TestCalculatorClass:
         """Create calculator instance."""
         return Calculator(precision=2)
 
-    def test_init(self):
+    @pytest.fixture(scope="module")
+    def calc_ro(self):
+        """Create calculator instance shared by tests that do not change its state.
+
+        Tests using it must not perform operations, or later users would see
+        a non-empty history and a last result.
+        """
+        return Calculator(precision=3)
+
+    def test_init(self, calc_ro):
         """Test calculator initialization."""
-        calc = Calculator(precision=3)
-        assert calc.precision == 3
-        assert calc.history == []
-        assert calc.last_result is None
+        assert calc_ro.precision == 3
+        assert len(calc_ro.history) == 0
+        assert calc_ro.last_result is None
+        assert calc_ro.logger is None
 
     def test_add(self, calc):
         """Test addition with class."""
         result = calc.add(2, 3)
         assert result == 5
         assert calc.last_result == 5
-        assert "2 + 3 = 5" in calc.history
+        assert "2 + 3 = 5" in calc.get_history()
 
     def test_divide_with_history(self, calc):
         """Test division tracks history."""
@@ -33,6 +42,14 @@ class TestCalculatorClass:
         assert result == 5
         assert len(calc.history) == 1
 
+    def test_get_history_snapshot(self, calc):
+        """Test history snapshot is unaffected by later operations."""
+        calc.add(1, 2)
+        snapshot = calc.get_history()
+        calc.multiply(3, 4)
+        assert snapshot == ("1 + 2 = 3",)
+        assert list(calc.iter_history()) == ["1 + 2 = 3", "3 * 4 = 12"]
+
     def test_chain_operations(self, calc):
         """Test chaining operations."""
         calc.add(10, 5)  # 15
@@ -43,10 +60,24 @@ class TestCalculatorClass:
         result = calc.chain_operation("div", 3)  # 10
         assert result == 10
 
-    def test_chain_without_previous(self, calc):
+    def test_divide_by_zero_history(self, calc):
+        """Test failed division is recorded without touching last result."""
+        calc.add(1, 1)
+        with pytest.raises(ValueError, match="Cannot divide by zero"):
+            calc.divide(10, 0)
+        assert calc.get_history() == ("1 + 1 = 2", "10 / 0 = ERROR")
+        assert calc.last_result == 2
+
+    def test_chain_without_previous(self, calc_ro):
         """Test chain fails without previous result."""
         with pytest.raises(ValueError, match="No previous result"):
-            calc.chain_operation("add", 5)
+            calc_ro.chain_operation("add", 5)
+
+    def test_chain_unknown_operation(self, calc):
+        """Test chain fails on unknown operation."""
+        calc.add(1, 2)
+        with pytest.raises(ValueError, match="Unknown operation: pow"):
+            calc.chain_operation("pow", 2)
 
     def test_clear_history(self, calc):
         """Test clearing history."""
@@ -58,6 +89,14 @@ class TestCalculatorClass:
         assert len(calc.history) == 0
         assert calc.last_result is None
 
+    def test_history_limit(self):
+        """Test history keeps only the most recent operations."""
+        calc = Calculator(precision=2, history_limit=2)
+        calc.add(1, 1)
+        calc.add(2, 2)
+        calc.add(3, 3)
+        assert calc.get_history() == ("2 + 2 = 4", "3 + 3 = 6")
+
     def test_precision(self):
         """Test precision setting."""
         calc = Calculator(precision=1)
@@ -0,0 +1,46 @@
+"""Tests for calculator package lazy exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import calculator
+
+
+class TestLazyExports:
+    """Test package-level lazy attribute loading."""
+
+    def test_import_does_not_load_submodules(self):
+        """Test plain import leaves the submodules unloaded."""
+        code = (
+            "import sys, calculator; "
+            "print('calculator.calculator_class' in sys.modules, "
+            "'calculator.calculator' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.split() == ["False", "False"]
+
+    @pytest.mark.parametrize(
+        "name,module_name",
+        [
+            ("Calculator", "calculator.calculator_class"),
+            ("calculate_average_np", "calculator.calculator"),
+        ],
+    )
+    def test_lazy_attribute(self, name, module_name):
+        """Test lazy attribute resolves to the submodule object and is cached."""
+        value = getattr(calculator, name)
+        assert value is getattr(sys.modules[module_name], name)
+        assert vars(calculator)[name] is value
+
+    def test_unknown_attribute(self):
+        """Test unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            _ = calculator.missing
+
+    def test_dir_lists_exports(self):
+        """Test dir() includes exports that are not yet loaded."""
+        assert set(calculator.__all__) <= set(dir(calculator))